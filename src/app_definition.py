@@ -1,8 +1,9 @@
 """module for app defintions to select a glyph.
 
-the only function this module exports is :func:`get_glyph()`,
-everything else here is to facilitate user to write app definitions
-with minimal boilerplate.
+the only functions this module exports are :func:`get_glyph()`,
+:func:`make_get_glyph()` and :func:`intern_class()`, everything else
+here is to facilitate user to write app definitions with minimal
+boilerplate.
 for anyone wishing to extend the module for their own configuration
 (as you should), define your app definitions in :class:`AppDefinition`
 as a function of the form `is_{app_name}`, and put an entry in your
@@ -10,7 +11,9 @@ config file under glyphs with "{app_name}: {glyph}"
 """
 
 import inspect
+from functools import wraps
 import re
+import sys
 
 
 def is_app_definition(f):
@@ -29,6 +32,24 @@ def priority(priority_):
     return wrapper
 
 
+def window_class(*classes):
+    """define an app definition which matches on the window class
+    alone, i.e. `app.class_ in classes`. the body of the decorated
+    function is not used, only its name.
+
+    such definitions are looked up directly by window class in
+    :func:`get_glyph` instead of being called one by one, so prefer
+    this for the simple (and most common) case.
+    """
+    def wrapper(fn):
+        @wraps(fn)
+        def app_def(app):
+            return app.class_ in classes
+        app_def.window_classes = classes
+        return app_def
+    return wrapper
+
+
 class StaticMethodPriorityMeta(type):
     """convert all methods of a deriving class into staticmethods,
     and default their priorities to 0."""
@@ -51,19 +72,24 @@ class AppDefinition(metaclass=StaticMethodPriorityMeta):
     all such (is_{app_name}) functions should take a single argument
     (app), and can use `app.name`, `app.class_`, `app.instance_` attrs
     to get access to the app's window title, window class string, and
-    window instance string, in addition to other attributes of
-    `i3ipc.i3ipc.Con`.
+    window instance string. glyphs are memoized on these three, so no
+    other attributes are available.
 
     use the `priority` decorator to increase the priority of an app
     definition. the default priority of each definition is 0. an app
     definition is evaluated before all others with a lower priority.
+
+    use the `window_class` decorator for definitions which only check
+    the window class - it builds the definition from the given classes.
     """
 
+    @window_class("Uget-gtk")
     def is_download_manager(app):
-        return app.class_ == "Uget-gtk"
+        pass
 
+    @window_class("Firefox", "Google-chrome", "qutebrowser")
     def is_browser(app):
-        return app.class_ in ("Firefox", "Google-chrome", "qutebrowser")
+        pass
 
     youtube_re = re.compile(r"(^(\(\d+\))?YouTube)|(- YouTube)")
 
@@ -72,56 +98,69 @@ class AppDefinition(metaclass=StaticMethodPriorityMeta):
         return AppDefinition.is_browser(app) \
             and AppDefinition.youtube_re.search(app.name)
 
+    @window_class("Tor Browser")
     def is_tor(app):
-        return app.class_ == "Tor Browser"
+        pass
 
+    @window_class("Okular", "Zathura", "Foxit Reader", "MuPDF")
     def is_pdf_reader(app):
-        return app.class_ in ("Okular", "Zathura", "Foxit Reader", "MuPDF")
+        pass
 
+    @window_class(
+        "Vmplayer", "VirtualBox", "VirtualBox Manager", "VirtualBox Machine")
     def is_virtual_machine(app):
-        return app.class_ in \
-            ("Vmplayer", "VirtualBox", "VirtualBox Manager", "VirtualBox Machine")
+        pass
 
     def is_media_player(app):
         return app.class_ and app.class_.lower() in ("vlc", "mplayer")
 
+    @window_class("Wireshark")
     def is_wireshark(app):
-        return app.class_ == "Wireshark"
+        pass
 
+    @window_class("Gnome-terminal", "URxvt", "XTerm", "st-256color")
     def is_terminal(app):
-        return app.class_ in ("Gnome-terminal", "URxvt", "XTerm", "st-256color")
+        pass
 
+    @window_class("Nautilus")
     def is_file_browser(app):
-        return app.class_ == "Nautilus"
+        pass
 
+    @window_class("Pinta", "Pqiv", "feh", "Eog")
     def is_image_viewer(app):
-        return app.class_ in ("Pinta", "Pqiv", "feh", "Eog")
+        pass
 
+    @window_class("fontforge")
     def is_fontforge(app):
-        return app.class_ == "fontforge"
+        pass
 
     def is_office(app):
         return app.class_ and app.class_.startswith("libreoffice")
 
+    @window_class("Gvim")
     def is_gvim(app):
-        return app.class_ == "Gvim"
+        pass
 
+    @window_class("Gedit")
     def is_editor(app):
-        return app.class_ == "Gedit"
+        pass
 
     def is_android_studio(app):
         return app.class_ == "jetbrains-studio" \
             and app.instance_ == "sun-awt-X11-XFramePeer" \
             and app.name and "Android Studio" in app.name.split(" - ")[-1]
 
+    @window_class("Skype")
     def is_skype(app):
-        return app.class_ == "Skype"
+        pass
 
+    @window_class("IDA")
     def is_ida(app):
-        return app.class_ == "IDA"
+        pass
 
+    @window_class("Steam")
     def is_steam(app):
-        return app.class_ == "Steam"
+        pass
 
     def is_burp_suite(app):
         return app.name and app.name.startswith("Burp Suite")
@@ -129,23 +168,120 @@ class AppDefinition(metaclass=StaticMethodPriorityMeta):
     def is_gephi(app):
         return app.class_ and "Gephi" in app.class_
 
+    @window_class("Zeal")
     def is_zeal(app):
-        return app.class_ == "Zeal"
+        pass
 
+    @window_class("Gitk")
     def is_gitk(app):
-        return app.class_ == "Gitk"
+        pass
 
+    @window_class("Bless")
     def is_bless(app):
-        return app.class_ == "Bless"
+        pass
 
+    @window_class("discord")
     def is_discord(app):
-        return app.class_ == "discord"
+        pass
 
+    @window_class("todoist")
     def is_todoist(app):
-        return app.class_ == "todoist"
+        pass
 
+    @window_class("Inkscape")
     def is_inkscape(app):
-        return app.class_ == "Inkscape"
+        pass
+
+
+# (name, definition) of every app definition, in order of evaluation
+# (by priority). computed once, since :class:`AppDefinition` is fixed.
+_APP_DEFS = tuple(
+    (get_app_name(attr), attr) for attr in sorted(
+        (attr for attr in AppDefinition.__dict__.values()
+         if is_app_definition(attr)),
+        key=lambda f: f.priority, reverse=True)
+)
+
+# every window class marked with :func:`window_class`, interned
+_KNOWN_CLASSES = frozenset(
+    sys.intern(class_)
+    for _, app_def in _APP_DEFS
+    for class_ in getattr(app_def, "window_classes", ())
+)
+
+
+def intern_class(class_):
+    """intern a window class if it is a known one, so that looking it
+    up in the dicts made by :func:`make_get_glyph` (and any other dict
+    keyed by it) matches by identity instead of comparing the whole
+    string.
+
+    :param class_: window class string
+    :type class_: str or None
+    :returns: the interned window class, or `class_` if not known
+    :rtype: str or None
+    """
+    if class_ in _KNOWN_CLASSES:
+        return sys.intern(class_)
+    return class_
+
+
+# functions made by :func:`make_get_glyph`, memoized per glyphs dict.
+# the dict is kept alongside so that its id can't be reused.
+_get_glyph_cache = {}
+
+
+def make_get_glyph(glyphs):
+    """make a function which chooses a glyph for an app, specialized
+    for the given glyphs. see :func:`get_glyph`.
+
+    the function is generated as a flat chain of checks over the app
+    definitions which have a glyph, in order of priority. a dynamic
+    definition becomes a single call, and each run of definitions
+    marked with :func:`window_class` becomes a single dict lookup on
+    the window class.
+
+    :param glyphs: dictionary of glyphs (app name: glyph) to use to get
+        the appropriate glyph
+    :type glyphs: dict
+    :returns: function taking an app and returning its glyph, or None
+    :rtype: callable
+    """
+    cached = _get_glyph_cache.get(id(glyphs))
+    if cached is not None and cached[0] is glyphs:
+        return cached[1]
+
+    namespace = {"_missing": object()}
+    lines = ["def get_glyph(app):", "    class_ = app.class_"]
+    classes = None
+    for index, (app_name, app_def) in enumerate(_APP_DEFS):
+        if app_name not in glyphs:
+            continue
+        if hasattr(app_def, "window_classes"):
+            if classes is None:
+                classes = {}
+                namespace["_classes_{}".format(index)] = classes
+                lines += [
+                    "    glyph = _classes_{}.get(class_, _missing)".format(
+                        index),
+                    "    if glyph is not _missing:",
+                    "        return glyph",
+                ]
+            for class_ in app_def.window_classes:
+                classes.setdefault(sys.intern(class_), glyphs[app_name])
+        else:
+            classes = None
+            namespace["_app_def_{}".format(index)] = app_def
+            namespace["_glyph_{}".format(index)] = glyphs[app_name]
+            lines += [
+                "    if _app_def_{}(app):".format(index),
+                "        return _glyph_{}".format(index),
+            ]
+    lines.append("    return None")
+
+    exec(compile("\n".join(lines), "<get_glyph>", "exec"), namespace)
+    _get_glyph_cache[id(glyphs)] = (glyphs, namespace["get_glyph"])
+    return namespace["get_glyph"]
 
 
 def get_glyph(app, glyphs):
@@ -153,8 +289,10 @@ def get_glyph(app, glyphs):
 
     find app definitions from :class:`AppDefintion` - these are the
     functions of the form `is_{app_name}`.  for each app, these are
-    tried (in no particular order) and the first one that returns true
+    tried in order of priority and the first one that returns true
     is picked, and the glyph for that app name is chosen from `glyphs`.
+    definitions marked with :func:`window_class` are found with a single
+    lookup on the window class, see :func:`make_get_glyph`.
     return None if no app definitions match, and the function calling
     this one chooses the glyph for "undefined".
 
@@ -166,14 +304,4 @@ def get_glyph(app, glyphs):
     :returns: glyph for app
     :rtype: str
     """
-
-    app_definitions = [
-        attr for attr in
-        AppDefinition.__dict__.values()
-        if is_app_definition(attr)
-    ]
-    app_definitions.sort(key=lambda f: f.priority, reverse=True)
-    for app_def_func in app_definitions:
-        app_name = get_app_name(app_def_func)
-        if app_name in glyphs and app_def_func(app):
-            return glyphs.get(app_name)
+    return make_get_glyph(glyphs)(app)
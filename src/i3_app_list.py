@@ -6,10 +6,9 @@ import i3ipc
 import argparse
 import yaml
 import yamale
-import munch
 import os
-from collections import defaultdict
-from functools import wraps
+from collections import namedtuple
+from functools import lru_cache
 import daemon
 import logging
 from logging.handlers import RotatingFileHandler
@@ -17,6 +16,12 @@ import atexit
 import pprint
 import pickle
 
+# prefer the libyaml parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 LOG_FILE = "/tmp/i3_app_list.log"
 logger = None
 
@@ -37,54 +42,74 @@ def setup_logging():
     atexit.register(lambda: logger.info("--- exiting ---"))
 
 
-def color_pango(text, fgcolor=None, bgcolor=None):
-    """return text formatted with pango backend with foreground and
-    background color tags. does not add foreground tag if fgcolor is
-    None. same for bgcolor.
+def pango_tags(fgcolor=None, bgcolor=None):
+    """return the opening and closing tags which format text with pango
+    backend with foreground and background color. does not add
+    foreground tag if fgcolor is None. same for bgcolor.
 
-    :param text: string to be colored
-    :type text: str
     :param fgcolor: foreground color
     :type fgcolor: str or None
     :param bgcolor: background color
     :type bgcolor: str or None
-    :returns: color tagged text
-    :rtype: str
+    :returns: opening and closing tags
+    :rtype: tuple(str, str)
     """
     fg_tag = "foreground='{}'".format(fgcolor) \
         if fgcolor else ""
     bg_tag = "background='{}'".format(bgcolor) \
         if bgcolor else ""
-    return "<span {fg} {bg}>{text}</span>".format(
-        fg=fg_tag, bg=bg_tag, text=text,
-    )
+    return "<span {fg} {bg}>".format(fg=fg_tag, bg=bg_tag), "</span>"
 
 
-def color_cairo(text, fgcolor=None, bgcolor=None):
-    """return text formatted with cairo backend with foreground and
-    background color tags. does not add foreground tag if fgcolor is
-    None. same for bgcolor.
+def cairo_tags(fgcolor=None, bgcolor=None):
+    """return the opening and closing tags which format text with cairo
+    backend with foreground and background color. does not add
+    foreground tag if fgcolor is None. same for bgcolor.
 
-    :param text: string to be colored
-    :type text: str
     :param fgcolor: foreground color
     :type fgcolor: str or None
     :param bgcolor: background color
     :type bgcolor: str or None
-    :returns: color tagged text
-    :rtype: str
+    :returns: opening and closing tags
+    :rtype: tuple(str, str)
     """
-    return "{fg_start}{bg_start}{text}{fg_end}{bg_end}".format(
+    start = "{fg_start}{bg_start}".format(
         fg_start="%{{F{0}}}".format(fgcolor) if fgcolor is not None else "",
         bg_start="%{{B{0}}}".format(bgcolor) if bgcolor is not None else "",
-        text=text,
+    )
+    end = "{fg_end}{bg_end}".format(
         fg_end="%{F-}" if fgcolor is not None else "",
         bg_end="%{B-}" if bgcolor is not None else "",
     )
+    return start, end
+
 
+@lru_cache(maxsize=16)
+def make_colorizer(backend, fgcolor=None, bgcolor=None):
+    """return a function which colors text with the given backend,
+    foreground and background color. there are only a handful of color
+    groups, so the tags are built once per group instead of per call.
 
-def color(backend, *args):
-    return {"pango": color_pango, "cairo": color_cairo}[backend](*args)
+    :param backend: backend to format text for
+    :type backend: str
+    :param fgcolor: foreground color
+    :type fgcolor: str or None
+    :param bgcolor: background color
+    :type bgcolor: str or None
+    :returns: function taking text and returning color tagged text
+    :rtype: callable
+    """
+    start, end = {"pango": pango_tags, "cairo": cairo_tags}[backend](
+        fgcolor, bgcolor)
+    # format rather than concatenate, so that a missing (None) glyph
+    # is still printed instead of raising
+    fmt = start.replace("{", "{{").replace("}", "}}") + "{}" \
+        + end.replace("{", "{{").replace("}", "}}")
+    return fmt.format
+
+
+def color(backend, text, fgcolor=None, bgcolor=None):
+    return make_colorizer(backend, fgcolor, bgcolor)(text)
 
 
 class ValidationError(Exception):
@@ -92,71 +117,84 @@ class ValidationError(Exception):
     pass
 
 
-def log_exceptions(func):
-    @wraps(func)
-    def wrapped(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
+# the attributes of an app which app definitions can use.
+# hashable, so that glyphs can be memoized on it.
+AppKey = namedtuple("AppKey", ("class_", "instance_", "name"))
+
+
+@lru_cache(maxsize=256)
+def resolve_glyph(app_key, settings):
+    """get a small string representation for an app. try to get it from
+    the user-customized module :module:`app_definition`. in case of
+    exceptions, simply return the `undefined` glyph.  if `debug` is
+    true, also log the exception (so that the dev knows that app
+    definitions are broken).
+
+    memoized, since the glyph only depends on the app key and the
+    settings - most events leave most windows unchanged.
+
+    :param app_key: app to get glyph for
+    :type app_key: :class:`AppKey`
+    :param settings: user settings
+    :type settings: :class:`Settings`
+    :return: repr for the app
+    :rtype: str
+    """
+    try:
+        glyph = settings.get_glyph(app_key)
+        if glyph is not None:
+            return glyph
+    except Exception as e:
+        # the daemon has no stderr, so log instead of raising -
+        # raising out of an event handler would stop the daemon
+        if settings.debug is True and logger is not None:
             logger.exception(
-                ("{funcname}({_args}, {_kwargs}) "
-                 "raised {exc_class}: {exc_msg}").format(
-                     funcname=func.__name__,
-                     _args=', '.join(map(repr, args)),
-                     _kwargs=', '.join(map(repr, kwargs)),
-                     exc_class=type(e).__name__,
-                     exc_msg=e,
-                 )
-            )
-    return wrapped
+                "resolve_glyph({!r}) raised {}: {}".format(
+                    app_key, type(e).__name__, e))
+
+    return settings.glyphs.get('undefined')
 
 
 class App:
 
-    """Application class to extend :class`i3ipc.i3ipc.Con`."""
+    """Application class based on top of :class`i3ipc.i3ipc.Con`."""
+
+    __slots__ = (
+        "settings", "id", "class_", "instance_", "name", "focused",
+        "workspace_id",
+    )
 
-    def __init__(self, con, settings):
+    def __init__(self, con, settings, workspace_id):
         """
         :type con: :class:`i3ipc.i3ipc.Con`
+        :param workspace_id: id of the workspace the app is under
+        :type workspace_id: int
         """
         assert isinstance(con, i3ipc.i3ipc.Con), \
             "con must be an instance of :class:`i3ipc.i3ipc.Con`"
         self.settings = settings
-        self._con = con
-
-    def __getattr__(self, attr):
-        """delegate to the underlying :class`i3ipc.i3ipc.Con`'s
-        attributes.
-        """
-        # `app.class_` returns `app.window_class` and
-        # `app.instance_` returns `app.window_instance`
+        # snapshot the attributes we need from the con, instead of
+        # keeping it (and with it, the whole tree it belongs to).
+        # `app.class_` is `con.window_class` and
+        # `app.instance_` is `con.window_instance`
         # to make writing app definitions easier
-        attr = 'window_class' if attr == 'class_' else attr
-        attr = 'window_instance' if attr == 'instance_' else attr
-        return getattr(self._con, attr)
+        self.id = con.id
+        self.class_ = app_definition.intern_class(con.window_class)
+        self.instance_ = con.window_instance
+        self.name = con.name
+        self.focused = con.focused
+        self.workspace_id = workspace_id
 
     @property
-    @log_exceptions
     def glyph(self):
         """get a small string representation for the app.
-        try to get it from the user-customized module
-        :module:`app_definition`. in case of exceptions,
-        simply return the `undefined` glyph.  if `debug`
-        is true, break the program (so that the dev knows
-        that app definitions are broken).
+        see :func:`resolve_glyph`.
 
         :return: repr for the app
         :rtype: str
         """
-        try:
-            glyph = app_definition.get_glyph(self, self.settings.glyphs)
-            if glyph is not None:
-                return glyph
-        except Exception as e:
-            if self.settings.debug is True:
-                raise e
-
-        return self.settings.glyphs.get('undefined')
+        return resolve_glyph(
+            AppKey(self.class_, self.instance_, self.name), self.settings)
 
 
     def __repr__(self):
@@ -174,9 +212,9 @@ class App:
         """return a string repr of the application, formatted
         according to user settings
         """
-        color_group = self.settings.apps.focused if self.focused \
-            else self.settings.apps.unfocused
-        return color(self.settings.backend, self.glyph, color_group.fg, color_group.bg)
+        colorize = self.settings.color_focused if self.focused \
+            else self.settings.color_unfocused
+        return colorize(self.glyph)
 
 
 class Settings:
@@ -184,6 +222,8 @@ class Settings:
     """class for user configuration."""
 
     SCHEMA_FILE = "./settings.yaml"
+    # schema made from `SCHEMA_FILE`, made on first validation
+    _schema = None
 
     def __init__(self, _file):
         """
@@ -203,7 +243,9 @@ class Settings:
         :type file: str
         :raises: :class:`ValidationError`
         """
-        schema = yamale.make_schema(cls.SCHEMA_FILE)
+        if cls._schema is None:
+            cls._schema = yamale.make_schema(cls.SCHEMA_FILE)
+        schema = cls._schema
         try:
             data = yamale.make_data(_file)
             yamale.validate(schema, data)
@@ -215,34 +257,65 @@ class Settings:
         raise :class:`ValidationError` if found invalid.
         """
         with open(self._file) as fp:
-            contents = yaml.load(fp)
-        munched_dict = munch.munchify(contents)
-        self.__dict__.update(**munched_dict)
+            contents = yaml.load(fp, Loader=YamlLoader)
+        self.__dict__.update(**contents)
 
     def _create_sensible_attrs(self):
         """mofify object's attrs to more sensible data strucutres"""
 
+        # pull what's needed while printing out of the nested settings,
+        # so that it's a single attribute access away.
         # create separators from settings
-        self.parts.separator = color(
+        parts_separator = self.parts["separator"]
+        self.parts_separator = color(
+            self.backend,
+            parts_separator["str"],
+            parts_separator["fg"],
+            parts_separator["bg"],
+        )
+        apps_separator = self.apps["separator"]
+        self.apps_separator = color(
             self.backend,
-            self.parts.separator.str,
-            self.parts.separator.fg,
-            self.parts.separator.bg,
+            apps_separator["str"],
+            apps_separator["fg"],
+            apps_separator["bg"],
         )
-        self.apps.separator = color(
+        # create colorizers for apps from settings
+        self.color_focused = make_colorizer(
             self.backend,
-            self.apps.separator.str,
-            self.apps.separator.fg,
-            self.apps.separator.bg,
+            self.apps["focused"]["fg"],
+            self.apps["focused"]["bg"],
         )
-        # unmunch glyphs
-        self.glyphs = self.glyphs.__dict__
+        self.color_unfocused = make_colorizer(
+            self.backend,
+            self.apps["unfocused"]["fg"],
+            self.apps["unfocused"]["bg"],
+        )
+        # glyphs are fixed from here on, so specialize glyph lookup
+        self.get_glyph = app_definition.make_get_glyph(self.glyphs)
+
+
+def quote_escape(name):
+    """escape a name to be put in double quotes in an i3 command. the
+    renames of all workspaces are sent as one command, so a stray quote
+    would break every rename after it.
+
+    :param name: name to escape
+    :type name: str
+    :returns: escaped name
+    :rtype: str
+    """
+    return name.replace("\\", "\\\\").replace('"', '\\"')
 
 
 class Workspace:
 
     """Workspace class based on top of :class:`i3ipc.i3ipc.Con`."""
 
+    __slots__ = (
+        "settings", "i3", "apps", "id", "name", "num", "custom_name", "dirty",
+    )
+
     def __init__(self, con, settings, i3, custom_name=None, num=None):
         """
         :param settings: user settings
@@ -256,42 +329,57 @@ class Workspace:
         :param num: workspace num to set to
         :type num: int
         """
-        self._con = con
         self.settings = settings
         self.i3 = i3
         self.apps = []
-        if num is not None:
-            self._con.num = num
+        self.id = con.id
+        self.name = con.name
+        self.num = num if num is not None else con.num
         self.custom_name = custom_name
+        # whether the workspace has to be printed again
+        self.dirty = True
 
     def __str__(self):
         """return a string representation to be printed on workspace
         buttons.
         """
-        num = str(self.num)
-        apps_str = self.settings.apps.separator.join(
-            str(app) for app in self.apps
-        )
-        return self.settings.parts.separator.join(
-            filter(bool, [num, self.custom_name, apps_str])
-        )
-
-    def __getattr__(self, attr):
-        """delegate to the underlying
-        :class`i3ipc.i3ipc.Con`.
+        separator = self.settings.parts_separator
+        name = str(self.num)
+        if self.custom_name:
+            name += separator + self.custom_name
+        if self.apps:
+            apps_str = self.settings.apps_separator.join(map(str, self.apps))
+            if apps_str:
+                name += separator + apps_str
+        return name
+
+    def rename_command(self, new_name):
+        """get the i3 command to rename the workspace to `new_name`.
+
+        :param new_name: name to rename workspace to
+        :type new_name: str
+        :returns: i3 command
+        :rtype: str
         """
-        return getattr(self._con, attr)
-
-    def output(self):
-        """print workspace to bar."""
         # workspace names have to be wrapped in double quotes
         # single quotes don't work, for some reason
-        new_name = str(self)
-        if new_name != self.name:
-            self.i3.command('rename workspace "{old}" to "{new}"'.format(
-                old=self.name, new=new_name
-            ))
-            self.name = new_name
+        return 'rename workspace "{old}" to "{new}"'.format(
+            old=quote_escape(self.name), new=quote_escape(new_name)
+        )
+
+
+def _walk_workspaces(root):
+    """get the leaves of every workspace of the tree, going down from
+    each workspace once instead of walking up from each leaf with
+    :meth:`i3ipc.i3ipc.Con.workspace`.
+
+    :param root: root of the i3 tree
+    :type root: :class:`i3ipc.i3ipc.Con`
+    :returns: pairs of workspace id, leaves under the workspace
+    :rtype: generator
+    """
+    for workspace in root.workspaces():
+        yield workspace.id, workspace.leaves()
 
 
 class Tree:
@@ -308,33 +396,54 @@ class Tree:
         self.i3 = i3
         self.settings = settings
         self.custom_names = custom_names if custom_names is not None else {}
-        self.workspaces = self.get_workspaces()
+        self.workspaces = self.get_workspaces(self.i3.get_tree())
+        self.index()
 
-    def get_apps(self):
+    def index(self):
+        """index workspaces and apps by id, so that single apps can be
+        updated in place by :class:`Watcher` without getting a new tree.
+        """
+        self.workspaces_by_id = {}
+        self.apps_by_id = {}
+        self.focused_app = None
+        for workspace in self.workspaces:
+            self.workspaces_by_id[workspace.id] = workspace
+            for app in workspace.apps:
+                self.apps_by_id[app.id] = app
+                if app.focused:
+                    self.focused_app = app
+
+    def get_apps(self, tree):
         """get mapping of workspace numbers: apps under workspace.
 
-        :returns: mapping of workspace number: apps
-        :rtype: defaultdict
+        :param tree: root of the i3 tree
+        :type tree: :class:`i3ipc.i3ipc.Con`
+        :returns: mapping of workspace number: apps, with an entry
+            for every workspace
+        :rtype: dict
         """
-        apps = [App(app, self.settings) for app in self.i3.get_tree().leaves()]
-        ws_app_mapping = defaultdict(list)
-        for app in apps:
-            ws_app_mapping[app.workspace().id].append(app)
-        return ws_app_mapping
+        return {
+            workspace_id: [
+                App(leaf, self.settings, workspace_id) for leaf in leaves
+            ]
+            for workspace_id, leaves in _walk_workspaces(tree)
+        }
 
-    def get_workspaces(self):
+    def get_workspaces(self, tree):
         """get a list of workspaces in the tree initialized with
         their apps.
 
+        :param tree: root of the i3 tree
+        :type tree: :class:`i3ipc.i3ipc.Con`
         :returns: list of initialized workspaces
         :rtype: list
         """
         workspaces = [
             Workspace(ws_con, self.settings, self.i3,
                       custom_name=self.custom_names.get(ws_con.id))
-            for ws_con in self.i3.get_tree().workspaces()
+            for ws_con in tree.workspaces()
         ]
-        workspace_apps = self.get_apps()
+        workspace_apps = self.get_apps(tree)
         for workspace in workspaces:
             workspace.apps = workspace_apps[workspace.id]
         return workspaces
@@ -347,9 +456,7 @@ class Tree:
         :returns: worspace from the tree which has that id, if it exists
         :rtype: :class:`Workspace` or None
         """
-        for workspace in self.workspaces:
-            if workspace.id == _id:
-                return workspace
+        return self.workspaces_by_id.get(_id)
 
     def get_workspace_by_num(self, num):
         """get a workspace from the tree which has the given num."""
@@ -367,10 +474,134 @@ class Tree:
         """
         self.get_workspace(_id).num = num
 
+    def focus_app(self, _id):
+        """mark the app with the given id as the only focused app.
+
+        :param _id: app id to focus
+        :type _id: int
+        :returns: whether there is such an app
+        :rtype: bool
+        """
+        app = self.apps_by_id.get(_id)
+        if app is None:
+            return False
+        if self.focused_app is not None:
+            self.focused_app.focused = False
+            self.workspaces_by_id[self.focused_app.workspace_id].dirty = True
+        app.focused = True
+        self.focused_app = app
+        self.workspaces_by_id[app.workspace_id].dirty = True
+        return True
+
+    def retitle_app(self, con):
+        """set the window title of the app for the given con. the window
+        class and instance are set again too, since some apps only set
+        them after their window is mapped.
+
+        :param con: con of the retitled window
+        :type con: :class:`i3ipc.i3ipc.Con`
+        :returns: whether there is such an app
+        :rtype: bool
+        """
+        app = self.apps_by_id.get(con.id)
+        if app is None:
+            return False
+        app.class_ = app_definition.intern_class(con.window_class)
+        app.instance_ = con.window_instance
+        app.name = con.name
+        self.workspaces_by_id[app.workspace_id].dirty = True
+        return True
+
+    def move_app(self, _id, tree):
+        """move the app with the given id to where it is in the given
+        tree. the apps of the workspaces it moved from and to are put
+        in the tree's order again, since a move can also reorder apps
+        within a workspace.
+
+        :param _id: app id to move
+        :type _id: int
+        :param tree: root of the i3 tree after the move
+        :type tree: :class:`i3ipc.i3ipc.Con`
+        :returns: whether the app could be moved - there must be such
+            an app and workspaces, every leaf under them must be a
+            known app, and the app must not leave its workspace empty
+            (i3 may have removed it)
+        :rtype: bool
+        """
+        app = self.apps_by_id.get(_id)
+        con = tree.find_by_id(_id)
+        if app is None or con is None:
+            return False
+        new_ws_con = con.workspace()
+        old_ws_con = tree.find_by_id(app.workspace_id)
+        if new_ws_con is None or old_ws_con is None:
+            return False
+
+        reordered = []
+        for ws_con in {old_ws_con.id: old_ws_con,
+                       new_ws_con.id: new_ws_con}.values():
+            workspace = self.workspaces_by_id.get(ws_con.id)
+            leaves = ws_con.leaves()
+            if workspace is None or not leaves or \
+                    any(leaf.id not in self.apps_by_id for leaf in leaves):
+                return False
+            reordered.append(
+                (workspace, [self.apps_by_id[leaf.id] for leaf in leaves]))
+
+        app.workspace_id = new_ws_con.id
+        for workspace, apps in reordered:
+            workspace.apps = apps
+            workspace.dirty = True
+        return True
+
+    def remove_app(self, _id):
+        """remove the app with the given id.
+
+        :param _id: app id to remove
+        :type _id: int
+        :returns: whether the app could be removed - there must be such
+            an app, and it must not leave its workspace empty (i3 may
+            have removed it)
+        :rtype: bool
+        """
+        app = self.apps_by_id.get(_id)
+        if app is None:
+            return False
+        workspace = self.workspaces_by_id[app.workspace_id]
+        if len(workspace.apps) == 1:
+            return False
+        workspace.apps.remove(app)
+        del self.apps_by_id[_id]
+        if self.focused_app is app:
+            self.focused_app = None
+        workspace.dirty = True
+        return True
+
     def output(self):
-        """print tree to bar."""
+        """print changed workspaces to bar. all renames are sent to i3
+        as a single command.
+        """
+        renames = []
         for workspace in self.workspaces:
-            workspace.output()
+            if not workspace.dirty:
+                continue
+            new_name = str(workspace)
+            if new_name == workspace.name:
+                workspace.dirty = False
+            else:
+                renames.append((workspace, new_name))
+        if not renames:
+            return
+
+        replies = self.i3.command("; ".join(
+            workspace.rename_command(new_name)
+            for workspace, new_name in renames
+        ))
+        # workspaces whose rename failed stay dirty, to be retried
+        for (workspace, new_name), reply in zip(renames, replies):
+            if reply.success:
+                workspace.name = new_name
+                workspace.dirty = False
 
 
 class Watcher:
@@ -381,17 +612,19 @@ class Watcher:
         self.settings = settings
         self.tree = Tree(self.i3, self.settings)
         self.custom_names = {}
+        # workspace num: "<num><separator>", see `num_prefix`
+        self._num_prefix_cache = {}
         self.subscribe()
 
     def subscribe(self):
         """subscribe to i3 events."""
         self.i3.on("workspace::rename", self.on_workspace_rename)
         self.i3.on("workspace::focus", self.rename_everything)
-        self.i3.on("window::focus", self.rename_everything)
-        self.i3.on("window::move", self.rename_everything)
-        self.i3.on("window::title", self.rename_everything)
+        self.i3.on("window::focus", self.on_window_focus)
+        self.i3.on("window::move", self.on_window_move)
+        self.i3.on("window::title", self.on_window_title)
         self.i3.on("window::new", self.rename_everything)
-        self.i3.on("window::close", self.rename_everything)
+        self.i3.on("window::close", self.on_window_close)
 
     def gc_custom_names(self):
         """remove records of custom names of workspaces that have
@@ -404,14 +637,29 @@ class Watcher:
             if workspace_id not in workspace_ids:
                 del self.custom_names[workspace_id]
 
+    def num_prefix(self, num):
+        """get the start of names given to the workspace with the given
+        num, when it has a custom name or apps.
+
+        :param num: workspace num
+        :type num: int
+        :returns: "<num><separator>"
+        :rtype: str
+        """
+        try:
+            return self._num_prefix_cache[num]
+        except KeyError:
+            prefix = str(num) + self.settings.parts_separator
+            self._num_prefix_cache[num] = prefix
+            return prefix
+
     def on_workspace_rename(self, i3, event):
         """if workspace name changed externally, use it as the custom
         name for the workspace and print workspaces to bar.
         """
         event_ws = event.current
         if event_ws.name == str(event_ws.num) or \
-                event_ws.name.startswith(str(event_ws.num)
-                                         + self.settings.parts.separator):
+                event_ws.name.startswith(self.num_prefix(event_ws.num)):
             # if new name is of the form
             # "<num>" or "<num><separator>...",
             # then we assume that the change was internal
@@ -434,6 +682,37 @@ class Watcher:
         self.tree = Tree(self.i3, self.settings, self.custom_names)
         self.tree.output()
 
+    def rename_changed(self, updated):
+        """print the workspaces changed by an event to bar. if the tree
+        couldn't be updated in place, fall back to renaming everything.
+
+        :param updated: whether the tree was updated in place
+        :type updated: bool
+        """
+        if updated:
+            self.tree.output()
+        else:
+            self.rename_everything()
+
+    def on_window_focus(self, i3, event):
+        """move the focus highlight to the newly focused app."""
+        self.rename_changed(self.tree.focus_app(event.container.id))
+
+    def on_window_title(self, i3, event):
+        """update the title of the app, since it can change its glyph."""
+        self.rename_changed(self.tree.retitle_app(event.container))
+
+    def on_window_move(self, i3, event):
+        """move the app to where it is now in the tree."""
+        # the event's container has no parents,
+        # so find the container in the tree to get its workspace
+        self.rename_changed(
+            self.tree.move_app(event.container.id, self.i3.get_tree()))
+
+    def on_window_close(self, i3, event):
+        """remove the closed app."""
+        self.rename_changed(self.tree.remove_app(event.container.id))
+
     def read_saved_names(self):
         """read saved custom names from save file to populate custom
         names.